@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass, asdict, field
+import os
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import Any
 
+_on_disk: dict[Path, bytes] = {}
 
-@dataclass
+
+@dataclass(slots=True)
 class AppState:
     last_folder_path: str
     last_page: str = "home"
@@ -31,40 +34,59 @@ class AppState:
     ai_api_key: str = ""
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        return {name: getattr(self, name) for name in _FIELD_NAMES}
 
     @classmethod
     def from_dict(cls, data: dict[str, Any], default_folder: str) -> "AppState":
-        state = cls(last_folder_path=default_folder)
-        for key, value in data.items():
-            if hasattr(state, key):
-                setattr(state, key, value)
-        return state
+        values = {name: data[name] for name in _FIELD_NAMES if name in data}
+        values.setdefault("last_folder_path", default_folder)
+        return cls(**values)
+
+
+_FIELD_NAMES = tuple(f.name for f in fields(AppState))
 
 
 def load_state(path: Path, default_folder: str) -> AppState:
     try:
-        if path.exists():
-            data = json.loads(path.read_text())
-            if isinstance(data, dict):
-                return AppState.from_dict(data, default_folder)
+        raw = path.read_bytes()
+        data = json.loads(raw)
+        _on_disk[path] = raw
+        if isinstance(data, dict):
+            return AppState.from_dict(data, default_folder)
     except Exception:
         pass
     return AppState(last_folder_path=default_folder)
 
 
 def save_state(path: Path, state: AppState) -> None:
+    payload = json.dumps(state.to_dict(), separators=(",", ":")).encode("utf-8")
+    if _on_disk.get(path) == payload:
+        return
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(state.to_dict(), indent=2))
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, path)
+    _on_disk[path] = payload
 
 
 def ensure_storage(storage_marker: Path, state_path: Path, default_folder: str) -> None:
+    try:
+        Path(default_folder).mkdir(parents=True, exist_ok=True)
+    except Exception:
+        pass
     try:
         state_path.parent.mkdir(parents=True, exist_ok=True)
-        if not state_path.exists():
-            save_state(state_path, AppState(last_folder_path=default_folder))
+        try:
+            with open(state_path, "xb") as handle:
+                payload = AppState(last_folder_path=default_folder).to_dict()
+                handle.write(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
+        except FileExistsError:
+            pass
         storage_marker.parent.mkdir(parents=True, exist_ok=True)
-        if not storage_marker.exists():
-            storage_marker.write_text("orca")
+        try:
+            with open(storage_marker, "x") as handle:
+                handle.write("orca")
+        except FileExistsError:
+            pass
     except Exception:
         pass
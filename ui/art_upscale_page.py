@@ -2,9 +2,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from PySide6.QtCore import QByteArray, Qt, QSize
-from PySide6.QtGui import QIcon, QPainter, QPixmap, QImage
-from PySide6.QtSvg import QSvgRenderer
+from PySide6.QtCore import Qt, QSize, QTimer
+from PySide6.QtGui import QPixmap, QImage
 from PySide6.QtWidgets import (
     QFrame,
     QHBoxLayout,
@@ -18,16 +17,7 @@ from PySide6.QtWidgets import (
 )
 
 from services.state import AppState
-
-
-def svg_icon(svg: str, size: int) -> QIcon:
-    image = QImage(size, size, QImage.Format_ARGB32)
-    image.fill(Qt.transparent)
-    painter = QPainter(image)
-    renderer = QSvgRenderer(QByteArray(svg.encode("utf-8")))
-    renderer.render(painter)
-    painter.end()
-    return QIcon(QPixmap.fromImage(image))
+from ui.icons import SETTINGS_SVG, svg_icon
 
 
 class ArtUpscalePage(QWidget):
@@ -37,6 +27,12 @@ class ArtUpscalePage(QWidget):
         self.on_theme_change = on_theme_change
         self.on_navigate = on_navigate
         self._files: list[Path] = []
+        self._preview_pixmap: QPixmap | None = None
+        self._preview_size: QSize | None = None
+        self._smooth_timer = QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.setInterval(100)
+        self._smooth_timer.timeout.connect(self._apply_smooth_preview)
         self._build_ui()
         self.set_theme(state.theme)
 
@@ -58,7 +54,7 @@ class ArtUpscalePage(QWidget):
         header_title.setObjectName("HeaderTitle")
         home_btn = QPushButton("Home")
         home_btn.setObjectName("NavButton")
-        home_btn.clicked.connect(lambda: self.on_navigate("home"))
+        home_btn.clicked.connect(self._go_home)
         nav_bar.addWidget(icon_badge)
         nav_bar.addWidget(header_title)
         nav_bar.addWidget(home_btn)
@@ -66,15 +62,9 @@ class ArtUpscalePage(QWidget):
 
         self.settings_icon_btn = QToolButton()
         self.settings_icon_btn.setObjectName("ThemeToggle")
-        self.settings_icon_btn.setIcon(
-            svg_icon(
-                '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#f01d85">'
-                '<path d="M12 8a4 4 0 1 0 0 8 4 4 0 0 0 0-8Zm8.94 4a7.87 7.87 0 0 0-.13-1.43l2.02-1.58-1.9-3.29-2.45.98a8.2 8.2 0 0 0-2.48-1.44L15.5 2h-3l-.5 2.24a8.2 8.2 0 0 0-2.48 1.44l-2.45-.98-1.9 3.29 2.02 1.58A7.87 7.87 0 0 0 7.06 12c0 .49.05.97.13 1.43l-2.02 1.58 1.9 3.29 2.45-.98a8.2 8.2 0 0 0 2.48 1.44L12.5 22h3l.5-2.24a8.2 8.2 0 0 0 2.48-1.44l2.45.98 1.9-3.29-2.02-1.58c.08-.46.13-.94.13-1.43Z" fill="#f7c6de"/></svg>',
-                12,
-            )
-        )
+        self.settings_icon_btn.setIcon(svg_icon(SETTINGS_SVG, 12))
         self.settings_icon_btn.setIconSize(QSize(12, 12))
-        self.settings_icon_btn.clicked.connect(lambda: self.on_navigate("settings"))
+        self.settings_icon_btn.clicked.connect(self._go_settings)
         nav_bar.addWidget(self.settings_icon_btn)
 
         top_divider = QFrame()
@@ -142,6 +132,12 @@ class ArtUpscalePage(QWidget):
 
         root_layout.addWidget(card)
 
+    def _go_home(self) -> None:
+        self.on_navigate("home")
+
+    def _go_settings(self) -> None:
+        self.on_navigate("settings")
+
     def set_theme(self, theme: str) -> None:
         return
 
@@ -167,13 +163,28 @@ class ArtUpscalePage(QWidget):
         if image.isNull():
             self._set_status("Failed to load image.", error=True)
             return
-        pixmap = QPixmap.fromImage(image)
-        self.input_view.setPixmap(pixmap.scaled(self.input_view.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        self._preview_pixmap = QPixmap.fromImage(image)
+        self._preview_size = None
+        self._apply_preview()
+
+    def _apply_preview(self) -> None:
+        target = self.input_view.size()
+        if self._preview_pixmap is None or target == self._preview_size:
+            return
+        self._preview_size = target
+        self.input_view.setPixmap(self._preview_pixmap.scaled(target, Qt.KeepAspectRatio, Qt.FastTransformation))
+        self._smooth_timer.start()
+
+    def _apply_smooth_preview(self) -> None:
+        if self._preview_pixmap is None or self._preview_size is None:
+            return
+        self.input_view.setPixmap(
+            self._preview_pixmap.scaled(self._preview_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        )
 
     def resizeEvent(self, event) -> None:
         super().resizeEvent(event)
-        if self._files:
-            self._load_preview(self._files[0])
+        self._apply_preview()
 
     def _upscale_stub(self) -> None:
         self._set_status("Upscale not implemented yet.", error=True)
@@ -1,14 +1,13 @@
 from __future__ import annotations
 
+import os
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 
-from PySide6.QtCore import QByteArray, QProcess, Qt, QSize, QUrl
-from PySide6.QtGui import QIcon, QPainter, QPainterPath, QPixmap, QRegion, QImage
-from PySide6.QtMultimedia import QAudioOutput, QMediaPlayer
-from PySide6.QtMultimediaWidgets import QVideoWidget
-from PySide6.QtSvg import QSvgRenderer
+from PySide6.QtCore import QProcess, QProcessEnvironment, Qt, QSize, QStringListModel, QTimer, QUrl
+from PySide6.QtGui import QRegion
 from PySide6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -29,30 +28,61 @@ from PySide6.QtWidgets import (
 )
 
 from services.state import AppState
-
-
-def svg_icon(svg: str, size: int) -> QIcon:
-    image = QImage(size, size, QImage.Format_ARGB32)
-    image.fill(Qt.transparent)
-    painter = QPainter(image)
-    renderer = QSvgRenderer(QByteArray(svg.encode("utf-8")))
-    renderer.render(painter)
-    painter.end()
-    return QIcon(QPixmap.fromImage(image))
+from ui.icons import SETTINGS_SVG, svg_icon
+
+_MEIPASS = getattr(sys, "_MEIPASS", None)
+_PROGRESS_TEMPLATE = "download:PCT %(progress._percent_str)s"
+_STATUS_MARKERS = (b"Destination:", b"Merging formats into")
+_PLAYLIST_OF_RE = re.compile(rb"of\s+(\d+)")
+_PLAYLIST_DL_RE = re.compile(rb"Downloading\s+(\d+)\s+(?:videos|items)", re.IGNORECASE)
+_PREVIEW_EXTS = (".mp4", ".mkv", ".webm")
+_CODEC_MAP = {"AV1": "av01", "H.264": "avc1", "HEVC": "hev1"}
+_TWO_DIGITS = tuple(f"{i:02d}" for i in range(60))
+
+
+@lru_cache(maxsize=4096)
+def _format_time_s(total_seconds: int) -> str:
+    minutes, seconds = divmod(total_seconds, 60)
+    if minutes < 60:
+        return _TWO_DIGITS[minutes] + ":" + _TWO_DIGITS[seconds]
+    return f"{minutes:02d}:{seconds:02d}"
+
+
+@lru_cache(maxsize=64)
+def _format_selector(quality: str, res_cap: str, codec: str) -> str:
+    parts = ["bv*+ba/b[quality=lowest]" if quality == "Worst" else "bv*+ba/b"]
+    if res_cap != "No cap":
+        height = res_cap.replace("p", "")
+        parts.append(f"[height<={height}]")
+    code = _CODEC_MAP.get(codec)
+    if code:
+        parts.append(f"[vcodec*={code}]")
+    return "".join(parts)
 
 
 class RoundedFrame(QFrame):
     def __init__(self, radius: int = 24, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self._radius = radius
+        self._mask_size: QSize | None = None
         self.setAttribute(Qt.WA_StyledBackground, True)
 
     def resizeEvent(self, event) -> None:
         super().resizeEvent(event)
-        path = QPainterPath()
-        rect = self.rect()
-        path.addRoundedRect(rect, self._radius, self._radius)
-        self.setMask(QRegion(path.toFillPolygon().toPolygon()))
+        size = self.size()
+        if size == self._mask_size:
+            return
+        self._mask_size = size
+        w = size.width()
+        h = size.height()
+        r = min(self._radius, w // 2, h // 2)
+        d = r * 2
+        region = QRegion(r, 0, w - d, h) | QRegion(0, r, w, h - d)
+        region |= QRegion(0, 0, d, d, QRegion.Ellipse)
+        region |= QRegion(w - d, 0, d, d, QRegion.Ellipse)
+        region |= QRegion(0, h - d, d, d, QRegion.Ellipse)
+        region |= QRegion(w - d, h - d, d, d, QRegion.Ellipse)
+        self.setMask(region)
 
 
 class DownloadPage(QWidget):
@@ -63,17 +93,38 @@ class DownloadPage(QWidget):
         self.on_navigate = on_navigate
 
         self.process = QProcess(self)
-        self.process.setProcessChannelMode(QProcess.MergedChannels)
+        self.process.setProcessChannelMode(QProcess.SeparateChannels)
+        env = QProcessEnvironment.systemEnvironment()
+        env.insert("PYTHONUNBUFFERED", "1")
+        self.process.setProcessEnvironment(env)
         self.process.readyReadStandardOutput.connect(self._on_process_output)
+        self.process.readyReadStandardError.connect(self._on_process_stderr)
         self.process.finished.connect(self._on_process_finished)
         self.process.errorOccurred.connect(self._on_process_error)
 
         self._current_output_path: Path | None = None
         self._last_progress = 0
-        self._last_info_line = ""
+        self._last_info_line = b""
+        self._last_error_line = b""
         self._playlist_requested: int | None = None
         self._playlist_total: int | None = None
         self._last_output_base: str | None = None
+        self._stdout_buf = bytearray()
+        self._stderr_buf = bytearray()
+        self._known_dirs: set[Path] = set()
+        self._pending_seek = 0
+        self._seek_timer = QTimer(self)
+        self._seek_timer.setSingleShot(True)
+        self._seek_timer.setInterval(30)
+        self._seek_timer.timeout.connect(self._apply_seek)
+        self._flush_pending = False
+        self._position_bucket = -1
+        self._position_seconds = -1
+        self._slider_px: tuple[int, int] | None = None
+        self._preview_text: str | None = None
+        self._preview_source: tuple[Path, int] | None = None
+        self._status_text: str | None = None
+        self._status_error: bool | None = None
 
         self._build_ui()
         self._sync_container_options()
@@ -98,7 +149,7 @@ class DownloadPage(QWidget):
         header_title.setObjectName("HeaderTitle")
         self.home_btn = QPushButton("Home")
         self.home_btn.setObjectName("NavButton")
-        self.home_btn.clicked.connect(lambda: self.on_navigate("home"))
+        self.home_btn.clicked.connect(self._go_home)
         nav_bar.addWidget(icon_badge)
         nav_bar.addWidget(header_title)
         nav_bar.addWidget(self.home_btn)
@@ -106,15 +157,9 @@ class DownloadPage(QWidget):
 
         self.settings_icon_btn = QToolButton()
         self.settings_icon_btn.setObjectName("ThemeToggle")
-        self.settings_icon_btn.setIcon(
-            svg_icon(
-                '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#f01d85">'
-                '<path d="M12 8a4 4 0 1 0 0 8 4 4 0 0 0 0-8Zm8.94 4a7.87 7.87 0 0 0-.13-1.43l2.02-1.58-1.9-3.29-2.45.98a8.2 8.2 0 0 0-2.48-1.44L15.5 2h-3l-.5 2.24a8.2 8.2 0 0 0-2.48 1.44l-2.45-.98-1.9 3.29 2.02 1.58A7.87 7.87 0 0 0 7.06 12c0 .49.05.97.13 1.43l-2.02 1.58 1.9 3.29 2.45-.98a8.2 8.2 0 0 0 2.48 1.44L12.5 22h3l.5-2.24a8.2 8.2 0 0 0 2.48-1.44l2.45.98 1.9-3.29-2.02-1.58c.08-.46.13-.94.13-1.43Z" fill="#f7c6de"/></svg>',
-                12,
-            )
-        )
+        self.settings_icon_btn.setIcon(svg_icon(SETTINGS_SVG, 12))
         self.settings_icon_btn.setIconSize(QSize(12, 12))
-        self.settings_icon_btn.clicked.connect(lambda: self.on_navigate("settings"))
+        self.settings_icon_btn.clicked.connect(self._go_settings)
         nav_bar.addWidget(self.settings_icon_btn)
 
         top_divider = QFrame()
@@ -170,6 +215,8 @@ class DownloadPage(QWidget):
         container_label = QLabel("FORMAT")
         container_label.setObjectName("FieldLabel")
         self.container_combo = QComboBox()
+        self._video_containers = QStringListModel(["mp4", "mkv", "webm"], self)
+        self._audio_containers = QStringListModel(["m4a", "mp3", "opus"], self)
 
         audio_label = QLabel("AUDIO")
         audio_label.setObjectName("FieldLabel")
@@ -269,7 +316,7 @@ class DownloadPage(QWidget):
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QScrollArea.NoFrame)
-        scroll.setStyleSheet("QScrollArea { background: transparent; } QScrollArea > QWidget { background: transparent; }")
+        scroll.setObjectName("DownloadScroll")
         scroll.setWidget(left_content)
 
         left_layout.addWidget(scroll)
@@ -279,21 +326,13 @@ class DownloadPage(QWidget):
         right_layout = QVBoxLayout(right)
         right_layout.setSpacing(14)
 
-        self.video_widget = QVideoWidget()
+        # The multimedia backend is only loaded once there is something to preview.
+        self.player = None
+        self.audio_output = None
+        self._QMediaPlayer = None
+        self.video_widget = QWidget()
         self.video_widget.setMinimumSize(160, 200)
         self.video_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.video_widget.setStyleSheet("")
-
-        self.player = QMediaPlayer(self)
-        self.audio_output = QAudioOutput(self)
-        self.audio_output.setVolume(0.6)
-        self.player.setAudioOutput(self.audio_output)
-        self.player.setVideoOutput(self.video_widget)
-        self.player.errorOccurred.connect(self._on_player_error)
-        self.player.mediaStatusChanged.connect(self._on_media_status)
-        self.player.playbackStateChanged.connect(self._sync_play_button)
-        self.player.positionChanged.connect(self._sync_position)
-        self.player.durationChanged.connect(self._sync_duration)
 
         self.preview_label = QLabel("Preview area")
         self.preview_label.setAlignment(Qt.AlignCenter)
@@ -303,9 +342,9 @@ class DownloadPage(QWidget):
         phone_frame.setObjectName("PhoneFrame")
         phone_frame.setMinimumSize(160, 200)
         phone_frame.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        phone_layout = QVBoxLayout(phone_frame)
-        phone_layout.setContentsMargins(8, 8, 8, 8)
-        phone_layout.addWidget(self.video_widget)
+        self.phone_layout = QVBoxLayout(phone_frame)
+        self.phone_layout.setContentsMargins(8, 8, 8, 8)
+        self.phone_layout.addWidget(self.video_widget)
 
         preview_card = QWidget()
         preview_card.setObjectName("PreviewCard")
@@ -333,7 +372,9 @@ class DownloadPage(QWidget):
         self.position_slider = QSlider(Qt.Horizontal)
         self.position_slider.setRange(0, 0)
         self.position_slider.setObjectName("SeekSlider")
-        self.position_slider.sliderMoved.connect(self.player.setPosition)
+        self.position_slider.sliderMoved.connect(self._queue_seek)
+        self.position_slider.sliderReleased.connect(self._on_slider_released)
+        self.position_slider.actionTriggered.connect(self._reset_slider_px)
 
         controls_row = QHBoxLayout()
         self.play_btn = QPushButton("Play")
@@ -426,14 +467,12 @@ class DownloadPage(QWidget):
             self.state.last_folder_path = path
 
     def _sync_container_options(self) -> None:
+        model = self._audio_containers if self.audio_only_toggle.isChecked() else self._video_containers
+        if self.container_combo.model() is model:
+            return
         self.container_combo.blockSignals(True)
-        self.container_combo.clear()
-        if self.audio_only_toggle.isChecked():
-            self.container_combo.addItems(["m4a", "mp3", "opus"])
-            self.container_combo.setCurrentText("m4a")
-        else:
-            self.container_combo.addItems(["mp4", "mkv", "webm"])
-            self.container_combo.setCurrentText("mp4")
+        self.container_combo.setModel(model)
+        self.container_combo.setCurrentIndex(0)
         self.container_combo.blockSignals(False)
 
     def _start_download(self) -> None:
@@ -444,7 +483,9 @@ class DownloadPage(QWidget):
 
         base_folder = Path(self.folder_input.text().strip() or self.state.last_folder_path)
         self.state.last_folder_path = str(base_folder)
-        base_folder.mkdir(parents=True, exist_ok=True)
+        if base_folder not in self._known_dirs:
+            base_folder.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(base_folder)
 
         template_text = self.filename_input.text().strip() or "%(title)s.%(ext)s"
         self._last_output_base = None
@@ -452,17 +493,26 @@ class DownloadPage(QWidget):
             base = Path(template_text).stem
             base = base or "video"
             suffix = ""
-            existing = list(base_folder.glob(f"{base}*.*"))
+            existing = False
+            max_n = 0
+            prefix = f"{base}_"
+            try:
+                with os.scandir(base_folder) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if not name.startswith(base) or "." not in name[len(base):]:
+                            continue
+                        existing = True
+                        stem = name.rpartition(".")[0]
+                        if stem == base:
+                            max_n = max(max_n, 1)
+                        elif stem.startswith(prefix):
+                            tail = stem[len(prefix):]
+                            if tail.isdecimal():
+                                max_n = max(max_n, int(tail))
+            except OSError:
+                self._known_dirs.discard(base_folder)
             if existing:
-                max_n = 0
-                for file in existing:
-                    stem = file.stem
-                    if stem == base:
-                        max_n = max(max_n, 1)
-                    else:
-                        match = re.match(rf"^{re.escape(base)}_(\d+)$", stem)
-                        if match:
-                            max_n = max(max_n, int(match.group(1)))
                 if max_n > 0:
                     suffix = f"_{max_n + 1}"
                 else:
@@ -474,9 +524,12 @@ class DownloadPage(QWidget):
         output_template = base_folder / template_text
         self._current_output_path = base_folder
         self._last_progress = 0
-        self._last_info_line = ""
+        self._last_info_line = b""
+        self._last_error_line = b""
+        self._stdout_buf.clear()
+        self._stderr_buf.clear()
 
-        args = ["--newline", "-o", str(output_template)]
+        args = ["--newline", "--no-colors", "--progress-template", _PROGRESS_TEMPLATE, "-o", str(output_template)]
 
         format_override = self.format_input.text().strip()
         audio_only = self.audio_only_toggle.isChecked()
@@ -485,24 +538,14 @@ class DownloadPage(QWidget):
         if format_override:
             args += ["-f", format_override]
         else:
-            quality = self.quality_combo.currentText()
-            res_cap = self.resolution_combo.currentText()
-            codec = self.codec_combo.currentText()
-
             if audio_only:
                 args += ["-f", "ba/b"]
             else:
-                fmt = "bv*+ba/b"
-                if quality == "Worst":
-                    fmt = "bv*+ba/b[quality=lowest]"
-                if res_cap != "No cap":
-                    height = res_cap.replace("p", "")
-                    fmt = f"{fmt}[height<={height}]"
-                if codec != "Any":
-                    codec_map = {"AV1": "av01", "H.264": "avc1", "HEVC": "hev1"}
-                    code = codec_map.get(codec, "")
-                    if code:
-                        fmt = f"{fmt}[vcodec*={code}]"
+                fmt = _format_selector(
+                    self.quality_combo.currentText(),
+                    self.resolution_combo.currentText(),
+                    self.codec_combo.currentText(),
+                )
                 args += ["-f", fmt]
 
         if audio_only:
@@ -529,17 +572,18 @@ class DownloadPage(QWidget):
         args.append(url)
 
         self._set_running(True)
-        self.status.setText(f"Saving to {base_folder}")
+        self._set_status(f"Saving to {base_folder}")
         self.status.setVisible(True)
         self._set_status_color(error=False)
-        self.preview_label.setText("Downloading... preview will update when ready.")
-        self.player.stop()
+        self._set_preview("Downloading... preview will update when ready.")
+        if self.player is not None:
+            self.player.stop()
 
         self.process.start(self._yt_dlp_cmd(), args)
 
     def _yt_dlp_cmd(self) -> str:
-        if hasattr(sys, "_MEIPASS"):
-            base = Path(getattr(sys, "_MEIPASS"))
+        if _MEIPASS is not None:
+            base = Path(_MEIPASS)
             bundled = base / "yt-dlp"
             if bundled.exists():
                 return str(bundled)
@@ -547,8 +591,8 @@ class DownloadPage(QWidget):
 
     def _ffmpeg_location(self) -> str | None:
         candidates: list[Path] = []
-        if hasattr(sys, "_MEIPASS"):
-            base = Path(getattr(sys, "_MEIPASS"))
+        if _MEIPASS is not None:
+            base = Path(_MEIPASS)
             candidates += [base / "ffmpeg", base / "ffprobe"]
         candidates += [Path("/opt/homebrew/bin/ffmpeg"), Path("/usr/local/bin/ffmpeg")]
         for path in candidates:
@@ -559,15 +603,15 @@ class DownloadPage(QWidget):
     def _is_playlist_url(self, url: str) -> bool:
         return "list=" in url
 
-    def _maybe_update_playlist_total(self, line: str) -> None:
+    def _maybe_update_playlist_total(self, line: bytes) -> None:
         if self._playlist_total is not None:
             return
         total = None
-        match = re.search(r"of\s+(\d+)", line)
+        match = _PLAYLIST_OF_RE.search(line)
         if match:
             total = int(match.group(1))
         else:
-            match = re.search(r"Downloading\s+(\d+)\s+(?:videos|items)", line, re.IGNORECASE)
+            match = _PLAYLIST_DL_RE.search(line)
             if match:
                 total = int(match.group(1))
         if total is None:
@@ -575,7 +619,7 @@ class DownloadPage(QWidget):
         self._playlist_total = total
         if self._playlist_requested and self._playlist_requested > total:
             self._playlist_requested = 0
-            self.status.setText(f"Playlist has {total} videos. Downloading all.")
+            self._set_status(f"Playlist has {total} videos. Downloading all.")
             self.status.setVisible(True)
 
     def _set_running(self, running: bool) -> None:
@@ -583,136 +627,278 @@ class DownloadPage(QWidget):
         self.url_input.setEnabled(not running)
 
     def _on_process_output(self) -> None:
-        data = self.process.readAllStandardOutput().data().decode(errors="ignore")
-        for line in data.splitlines():
-            self._parse_progress(line)
-
-    def _parse_progress(self, line: str) -> None:
-        if not line:
+        self._stdout_buf += self.process.readAllStandardOutput().data()
+        if not self._flush_pending:
+            self._flush_pending = True
+            QTimer.singleShot(50, self._flush_stdout)
+
+    def _on_process_stderr(self) -> None:
+        self._stderr_buf += self.process.readAllStandardError().data()
+        self._flush_stderr()
+
+    def _flush_stderr(self) -> None:
+        end = self._stderr_buf.rfind(b"\n")
+        if end < 0:
             return
+        lines = bytes(self._stderr_buf[:end]).splitlines()
+        del self._stderr_buf[: end + 1]
+        for line in lines:
+            line = line.strip()
+            if line.startswith(b"ERROR:"):
+                self._last_error_line = line
+
+    def _flush_stdout(self) -> None:
+        self._flush_pending = False
+        end = self._stdout_buf.rfind(b"\n")
+        if end < 0:
+            return
+        lines = bytes(self._stdout_buf[:end]).splitlines()
+        del self._stdout_buf[: end + 1]
+
+        status_line = None
+        for line in lines:
+            status_line = self._parse_progress(line) or status_line
+        if status_line is not None:
+            self._set_status(status_line.decode(errors="ignore"))
+            self._set_status_color(error=False)
 
-        self._maybe_update_playlist_total(line)
+    def _parse_progress(self, line: bytes) -> bytes | None:
+        line = line.strip()
+        if not line:
+            return None
 
-        match = re.search(r"\[download\]\s+(\d{1,3}\.\d+)%", line)
-        if match:
-            value = int(float(match.group(1)))
+        if line.startswith(b"PCT "):
+            try:
+                value = int(float(line[4:].rstrip(b"% ")))
+            except ValueError:
+                return None
             if value != self._last_progress:
                 self._last_progress = value
-            return
+            return None
 
-        if "Destination:" in line or "Merging formats into" in line:
-            self.status.setText(line.strip())
-            self._last_info_line = line.strip()
-            self._set_status_color(error=False)
-            return
+        self._maybe_update_playlist_total(line)
 
-        self._last_info_line = line.strip()
+        self._last_info_line = line
+        if any(marker in line for marker in _STATUS_MARKERS):
+            return line
+        return None
 
     def _on_process_error(self) -> None:
         self._set_running(False)
-        self.status.setText("Failed to start yt-dlp. Is it installed and on PATH?")
+        self._set_status("Failed to start yt-dlp. Is it installed and on PATH?")
         self.status.setVisible(True)
         self._set_status_color(error=True)
 
     def _on_process_finished(self, exit_code: int, _status: QProcess.ExitStatus) -> None:
+        self._stdout_buf += self.process.readAllStandardOutput().data()
+        if self._stdout_buf and not self._stdout_buf.endswith(b"\n"):
+            self._stdout_buf += b"\n"
+        self._flush_stdout()
+        self._stderr_buf += self.process.readAllStandardError().data()
+        if self._stderr_buf and not self._stderr_buf.endswith(b"\n"):
+            self._stderr_buf += b"\n"
+        self._flush_stderr()
         self._set_running(False)
         if exit_code != 0:
-            detail = self._last_info_line or "Download failed. Check the URL or yt-dlp output."
-            self.status.setText(detail)
+            last_line = self._last_error_line or self._last_info_line
+            detail = last_line.decode(errors="ignore") or "Download failed. Check the URL or yt-dlp output."
+            self._set_status(detail)
             self.status.setVisible(True)
             self._set_status_color(error=True)
             return
 
-        self.status.setText("Download complete.")
+        self._set_status("Download complete.")
         self.status.setVisible(True)
         self._set_status_color(error=False)
 
-        mp4_path = None
+        video_path = None
         if self._current_output_path:
             if self._last_output_base:
-                candidate = self._current_output_path / f"{self._last_output_base}.mp4"
-                if candidate.exists():
-                    mp4_path = candidate
+                for ext in _PREVIEW_EXTS:
+                    candidate = self._current_output_path / f"{self._last_output_base}{ext}"
+                    if candidate.exists():
+                        video_path = candidate
+                        break
             else:
-                latest = self._find_latest_video()
-                if latest:
-                    mp4_path = latest
+                video_path = self._find_latest_video()
 
-        if mp4_path:
-            self._load_preview(mp4_path)
+        if video_path:
+            self._load_preview(video_path)
         else:
-            self.preview_label.setText("No MP4 found for this download. Try MP4 format.")
+            self._set_preview("No video found for this download.")
 
     def _find_latest_video(self) -> Path | None:
-        if not self._current_output_path or not self._current_output_path.exists():
+        if not self._current_output_path:
             return None
-        candidates = list(self._current_output_path.glob("*.mp4"))
-        if not candidates:
+        latest = None
+        latest_mtime = -1
+        try:
+            with os.scandir(self._current_output_path) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(_PREVIEW_EXTS) or not entry.is_file():
+                        continue
+                    mtime = entry.stat().st_mtime_ns
+                    if mtime > latest_mtime:
+                        latest_mtime = mtime
+                        latest = entry.path
+        except OSError:
             return None
-        return max(candidates, key=lambda p: p.stat().st_mtime)
+        return Path(latest) if latest else None
 
     def _load_preview(self, path: Path) -> None:
-        if not path.exists():
-            self.preview_label.setText("Video file not found.")
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            self._set_preview("Video file not found.")
             return
-        self.preview_label.setText("")
-        url = QUrl.fromLocalFile(str(path))
-        self.player.setSource(url)
+        self._set_preview("")
+        self._position_bucket = -1
+        self._position_seconds = -1
+        self._slider_px = None
+        self._ensure_player()
+        source = (path, mtime)
+        if source != self._preview_source:
+            self._preview_source = source
+            self.player.setSource(QUrl.fromLocalFile(str(path)))
         self.player.play()
 
+    def _ensure_player(self) -> None:
+        if self.player is not None:
+            return
+        from PySide6.QtMultimedia import QAudioOutput, QMediaPlayer
+        from PySide6.QtMultimediaWidgets import QVideoWidget
+
+        video_widget = QVideoWidget()
+        video_widget.setMinimumSize(160, 200)
+        video_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.phone_layout.replaceWidget(self.video_widget, video_widget)
+        self.video_widget.deleteLater()
+        self.video_widget = video_widget
+
+        self._QMediaPlayer = QMediaPlayer
+        self.player = QMediaPlayer(self)
+        self.audio_output = QAudioOutput(self)
+        self.audio_output.setVolume(self.volume_slider.value() / 100)
+        self.audio_output.setMuted(self.mute_btn.isChecked())
+        self.player.setAudioOutput(self.audio_output)
+        self.player.setVideoOutput(self.video_widget)
+        self.player.errorOccurred.connect(self._on_player_error)
+        self.player.mediaStatusChanged.connect(self._on_media_status)
+        self.player.playbackStateChanged.connect(self._sync_play_button)
+        self.player.positionChanged.connect(self._sync_position)
+        self.player.durationChanged.connect(self._sync_duration)
+
+    def _set_preview(self, text: str) -> None:
+        if text == self._preview_text:
+            return
+        self._preview_text = text
+        self.preview_label.setText(text)
+
+    def _set_status(self, text: str) -> None:
+        if text == self._status_text:
+            return
+        self._status_text = text
+        self.status.setText(text)
+
     def _set_status_color(self, error: bool) -> None:
+        if error == self._status_error:
+            return
+        self._status_error = error
         color = "#b00020" if error else "#2a2a2a"
         self.status.setStyleSheet(f"color: {color};")
 
     def _toggle_play(self) -> None:
-        if self.player.playbackState() == QMediaPlayer.PlayingState:
+        if self.player is None:
+            return
+        if self.player.playbackState() == self._QMediaPlayer.PlayingState:
             self.player.pause()
         else:
             self.player.play()
 
     def _sync_play_button(self) -> None:
-        if self.player.playbackState() == QMediaPlayer.PlayingState:
+        if self.player.playbackState() == self._QMediaPlayer.PlayingState:
             self.play_btn.setText("Pause")
         else:
             self.play_btn.setText("Play")
 
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        if self.player is not None:
+            self._position_bucket = -1
+            self._sync_position(self.player.position())
+
     def _sync_position(self, position: int) -> None:
-        if not self.position_slider.isSliderDown():
-            self.position_slider.setValue(position)
-        self.current_time.setText(self._format_time(position))
+        if not self.isVisible():
+            return
+        bucket = position // 250
+        if bucket == self._position_bucket:
+            return
+        self._position_bucket = bucket
+        slider = self.position_slider
+        if not slider.isSliderDown():
+            width = slider.width()
+            px = (width, position * width // max(1, slider.maximum()))
+            if px != self._slider_px:
+                self._slider_px = px
+                slider.blockSignals(True)
+                slider.setValue(position)
+                slider.blockSignals(False)
+        seconds = position // 1000
+        if seconds != self._position_seconds:
+            self._position_seconds = seconds
+            self.current_time.setText(self._format_time(position))
+
+    def _reset_slider_px(self, *_args) -> None:
+        self._slider_px = None
 
     def _sync_duration(self, duration: int) -> None:
+        self.position_slider.blockSignals(True)
         self.position_slider.setRange(0, duration)
+        self.position_slider.blockSignals(False)
         self.total_time.setText(self._format_time(duration))
 
     def _toggle_mute(self, checked: bool) -> None:
-        self.audio_output.setMuted(checked)
+        if self.audio_output is not None:
+            self.audio_output.setMuted(checked)
         self.mute_btn.setText("Muted" if checked else "Mute")
 
     def _set_volume(self, value: int) -> None:
-        self.audio_output.setVolume(value / 100)
+        if self.audio_output is not None:
+            self.audio_output.setVolume(value / 100)
+
+    def _queue_seek(self, position: int) -> None:
+        self._pending_seek = position
+        if not self._seek_timer.isActive():
+            self._seek_timer.start()
+
+    def _apply_seek(self) -> None:
+        if self.player is not None:
+            self.player.setPosition(self._pending_seek)
+
+    def _on_slider_released(self) -> None:
+        if self._seek_timer.isActive():
+            self._seek_timer.stop()
+            self._apply_seek()
+        self._slider_px = None
 
     def _format_time(self, ms: int) -> str:
-        total_seconds = max(0, ms // 1000)
-        minutes = total_seconds // 60
-        seconds = total_seconds % 60
-        return f"{minutes:02d}:{seconds:02d}"
+        return _format_time_s(max(0, ms // 1000))
 
-    def _on_player_error(self, error: QMediaPlayer.Error, error_string: str) -> None:
-        if error == QMediaPlayer.NoError:
+    def _on_player_error(self, error, error_string: str) -> None:
+        if error == self._QMediaPlayer.NoError:
             return
         message = error_string or "Playback error."
-        self.preview_label.setText(message)
-        self.status.setText(message)
+        self._set_preview(message)
+        self._set_status(message)
         self._set_status_color(error=True)
 
-    def _on_media_status(self, status: QMediaPlayer.MediaStatus) -> None:
-        if status == QMediaPlayer.LoadingMedia:
-            self.preview_label.setText("Loading video...")
-        elif status == QMediaPlayer.BufferingMedia:
-            self.preview_label.setText("Buffering...")
-        elif status in (QMediaPlayer.LoadedMedia, QMediaPlayer.BufferedMedia):
-            self.preview_label.setText("")
+    def _on_media_status(self, status) -> None:
+        if status == self._QMediaPlayer.LoadingMedia:
+            self._set_preview("Loading video...")
+        elif status == self._QMediaPlayer.BufferingMedia:
+            self._set_preview("Buffering...")
+        elif status in (self._QMediaPlayer.LoadedMedia, self._QMediaPlayer.BufferedMedia):
+            self._set_preview("")
 
     def _on_theme_toggled(self, checked: bool) -> None:
         if checked:
@@ -722,5 +908,11 @@ class DownloadPage(QWidget):
             self.theme_toggle.setIcon(self._sun_icon)
             self.on_theme_change("Light")
 
+    def _go_home(self) -> None:
+        self.on_navigate("home")
+
+    def _go_settings(self) -> None:
+        self.on_navigate("settings")
+
     def set_theme(self, theme: str) -> None:
         return
@@ -2,9 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from PySide6.QtCore import QByteArray, Qt, QSize
-from PySide6.QtGui import QIcon, QPainter, QPixmap, QImage
-from PySide6.QtSvg import QSvgRenderer
+from PySide6.QtCore import Qt, QSize
 from PySide6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -23,16 +21,7 @@ from PySide6.QtWidgets import (
 
 from services.state import AppState
 from services.ai_client import generate_text, ai_available
-
-
-def svg_icon(svg: str, size: int) -> QIcon:
-    image = QImage(size, size, QImage.Format_ARGB32)
-    image.fill(Qt.transparent)
-    painter = QPainter(image)
-    renderer = QSvgRenderer(QByteArray(svg.encode("utf-8")))
-    renderer.render(painter)
-    painter.end()
-    return QIcon(QPixmap.fromImage(image))
+from ui.icons import SETTINGS_SVG, svg_icon
 
 
 class GenerateDocsPage(QWidget):
@@ -62,7 +51,7 @@ class GenerateDocsPage(QWidget):
         header_title.setObjectName("HeaderTitle")
         self.home_btn = QPushButton("Home")
         self.home_btn.setObjectName("NavButton")
-        self.home_btn.clicked.connect(lambda: self.on_navigate("home"))
+        self.home_btn.clicked.connect(self._go_home)
         nav_bar.addWidget(icon_badge)
         nav_bar.addWidget(header_title)
         nav_bar.addWidget(self.home_btn)
@@ -70,15 +59,9 @@ class GenerateDocsPage(QWidget):
 
         self.settings_icon_btn = QToolButton()
         self.settings_icon_btn.setObjectName("ThemeToggle")
-        self.settings_icon_btn.setIcon(
-            svg_icon(
-                '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#f01d85">'
-                '<path d="M12 8a4 4 0 1 0 0 8 4 4 0 0 0 0-8Zm8.94 4a7.87 7.87 0 0 0-.13-1.43l2.02-1.58-1.9-3.29-2.45.98a8.2 8.2 0 0 0-2.48-1.44L15.5 2h-3l-.5 2.24a8.2 8.2 0 0 0-2.48 1.44l-2.45-.98-1.9 3.29 2.02 1.58A7.87 7.87 0 0 0 7.06 12c0 .49.05.97.13 1.43l-2.02 1.58 1.9 3.29 2.45-.98a8.2 8.2 0 0 0 2.48 1.44L12.5 22h3l.5-2.24a8.2 8.2 0 0 0 2.48-1.44l2.45.98 1.9-3.29-2.02-1.58c.08-.46.13-.94.13-1.43Z" fill="#f7c6de"/></svg>',
-                12,
-            )
-        )
+        self.settings_icon_btn.setIcon(svg_icon(SETTINGS_SVG, 12))
         self.settings_icon_btn.setIconSize(QSize(12, 12))
-        self.settings_icon_btn.clicked.connect(lambda: self.on_navigate("settings"))
+        self.settings_icon_btn.clicked.connect(self._go_settings)
         nav_bar.addWidget(self.settings_icon_btn)
 
         top_divider = QFrame()
@@ -209,6 +192,12 @@ class GenerateDocsPage(QWidget):
 
         root_layout.addWidget(card)
 
+    def _go_home(self) -> None:
+        self.on_navigate("home")
+
+    def _go_settings(self) -> None:
+        self.on_navigate("settings")
+
     def set_theme(self, theme: str) -> None:
         return
 
@@ -1,8 +1,6 @@
 from __future__ import annotations
 
 from PySide6.QtCore import Qt, QSize, QRect, QPoint
-from PySide6.QtGui import QIcon, QPainter, QPixmap, QImage
-from PySide6.QtSvg import QSvgRenderer
 from PySide6.QtWidgets import (
     QFrame,
     QHBoxLayout,
@@ -16,19 +14,53 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QWidget,
 )
-from PySide6.QtCore import QByteArray
 
 from services.state import AppState
+from ui.icons import SETTINGS_SVG, svg_icon
 
-
-def svg_icon(svg: str, size: int) -> QIcon:
-    image = QImage(size, size, QImage.Format_ARGB32)
-    image.fill(Qt.transparent)
-    painter = QPainter(image)
-    renderer = QSvgRenderer(QByteArray(svg.encode("utf-8")))
-    renderer.render(painter)
-    painter.end()
-    return QIcon(QPixmap.fromImage(image))
+_DOWNLOAD_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#f01d85">'
+    '<path d="M12 3a1 1 0 0 1 1 1v8.17l2.59-2.58a1 1 0 1 1 1.41 1.42l-4.3 4.29a1 1 0 0 1-1.4 0L6 11.01a1 1 0 1 1 1.41-1.42L10 12.17V4a1 1 0 0 1 1-1Z"/>'
+    '<path d="M5 19a1 1 0 0 1 1-1h12a1 1 0 1 1 0 2H6a1 1 0 0 1-1-1Z"/></svg>'
+)
+_EDITOR_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#f01d85">'
+    '<path d="M4 20h4l9-9-4-4-9 9v4Z"/>'
+    '<path d="M14.5 5.5 18.5 9.5 20 8l-4-4-1.5 1.5Z"/></svg>'
+)
+_DOCUMENT_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#f01d85">'
+    '<path d="M6 2h7l5 5v15a2 2 0 0 1-2 2H6a2 2 0 0 1-2-2V4a2 2 0 0 1 2-2Z"/>'
+    '<path d="M13 2v5h5" fill="#f7c6de"/>'
+    '<path d="M8 12h8v2H8zm0 4h6v2H8z"/></svg>'
+)
+_IMAGES_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#f01d85">'
+    '<path d="M4 4h7v7H4z"/><path d="M13 4h7v7h-7z" fill="#f7c6de"/>'
+    '<path d="M4 13h7v7H4z" fill="#f7c6de"/><path d="M13 13h7v7h-7z"/>'
+    '<path d="M12 9h3v2h-3z"/></svg>'
+)
+_VIDEO_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#f01d85">'
+    '<path d="M4 5h10a2 2 0 0 1 2 2v1l4-2v10l-4-2v1a2 2 0 0 1-2 2H4a2 2 0 0 1-2-2V7a2 2 0 0 1 2-2Z"/>'
+    '<path d="M6 9h4v2H6zM6 13h6v2H6z" fill="#f7c6de"/></svg>'
+)
+_UPSCALE_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#f01d85">'
+    '<path d="M4 6h16v12H4z"/><path d="M7 9h4v4H7z" fill="#f7c6de"/>'
+    '<path d="M14 9h3v3h-3z"/></svg>'
+)
+_RENAME_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#f01d85">'
+    '<path d="M4 4h16v5H4z"/><path d="M4 10h10v10H4z" fill="#f7c6de"/>'
+    '<path d="M16 12h4v2h-4zM16 16h4v2h-4z"/></svg>'
+)
+_MIC_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#f01d85">'
+    '<path d="M12 14a3 3 0 0 0 3-3V6a3 3 0 0 0-6 0v5a3 3 0 0 0 3 3Z"/>'
+    '<path d="M5 11a7 7 0 0 0 14 0" fill="#f7c6de"/>'
+    '<path d="M12 18v3m-3 0h6" fill="#f01d85"/></svg>'
+)
 
 
 class FlowLayout(QLayout):
@@ -138,15 +170,9 @@ class HomePage(QWidget):
         nav_bar.addStretch(1)
         self.settings_icon_btn = QToolButton()
         self.settings_icon_btn.setObjectName("ThemeToggle")
-        self.settings_icon_btn.setIcon(
-            svg_icon(
-                '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#f01d85">'
-                '<path d="M12 8a4 4 0 1 0 0 8 4 4 0 0 0 0-8Zm8.94 4a7.87 7.87 0 0 0-.13-1.43l2.02-1.58-1.9-3.29-2.45.98a8.2 8.2 0 0 0-2.48-1.44L15.5 2h-3l-.5 2.24a8.2 8.2 0 0 0-2.48 1.44l-2.45-.98-1.9 3.29 2.02 1.58A7.87 7.87 0 0 0 7.06 12c0 .49.05.97.13 1.43l-2.02 1.58 1.9 3.29 2.45-.98a8.2 8.2 0 0 0 2.48 1.44L12.5 22h3l.5-2.24a8.2 8.2 0 0 0 2.48-1.44l2.45.98 1.9-3.29-2.02-1.58c.08-.46.13-.94.13-1.43Z" fill="#f7c6de"/></svg>',
-                12,
-            )
-        )
+        self.settings_icon_btn.setIcon(svg_icon(SETTINGS_SVG, 12))
         self.settings_icon_btn.setIconSize(QSize(12, 12))
-        self.settings_icon_btn.clicked.connect(lambda: self.on_navigate("settings"))
+        self.settings_icon_btn.clicked.connect(self._go_settings)
         nav_bar.addWidget(self.settings_icon_btn)
 
         title = QLabel("Choose an action")
@@ -157,14 +183,7 @@ class HomePage(QWidget):
         self.download_btn = QToolButton()
         self.download_btn.setObjectName("ActionButton")
         self.download_btn.setToolButtonStyle(Qt.ToolButtonTextUnderIcon)
-        self.download_btn.setIcon(
-            svg_icon(
-                '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#f01d85">'
-                '<path d="M12 3a1 1 0 0 1 1 1v8.17l2.59-2.58a1 1 0 1 1 1.41 1.42l-4.3 4.29a1 1 0 0 1-1.4 0L6 11.01a1 1 0 1 1 1.41-1.42L10 12.17V4a1 1 0 0 1 1-1Z"/>'
-                '<path d="M5 19a1 1 0 0 1 1-1h12a1 1 0 1 1 0 2H6a1 1 0 0 1-1-1Z"/></svg>',
-                24,
-            )
-        )
+        self.download_btn.setIcon(svg_icon(_DOWNLOAD_SVG, 24))
         self.download_btn.setIconSize(QSize(24, 24))
         self.download_btn.setText("Video Downloader")
         self.download_btn.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
@@ -173,14 +192,7 @@ class HomePage(QWidget):
         self.editor_btn = QToolButton()
         self.editor_btn.setObjectName("ActionButton")
         self.editor_btn.setToolButtonStyle(Qt.ToolButtonTextUnderIcon)
-        self.editor_btn.setIcon(
-            svg_icon(
-                '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#f01d85">'
-                '<path d="M4 20h4l9-9-4-4-9 9v4Z"/>'
-                '<path d="M14.5 5.5 18.5 9.5 20 8l-4-4-1.5 1.5Z"/></svg>',
-                24,
-            )
-        )
+        self.editor_btn.setIcon(svg_icon(_EDITOR_SVG, 24))
         self.editor_btn.setIconSize(QSize(24, 24))
         self.editor_btn.setText("Editor")
         self.editor_btn.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
@@ -189,15 +201,7 @@ class HomePage(QWidget):
         self.pdf_btn = QToolButton()
         self.pdf_btn.setObjectName("ActionButton")
         self.pdf_btn.setToolButtonStyle(Qt.ToolButtonTextUnderIcon)
-        self.pdf_btn.setIcon(
-            svg_icon(
-                '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#f01d85">'
-                '<path d="M6 2h7l5 5v15a2 2 0 0 1-2 2H6a2 2 0 0 1-2-2V4a2 2 0 0 1 2-2Z"/>'
-                '<path d="M13 2v5h5" fill="#f7c6de"/>'
-                '<path d="M8 12h8v2H8zm0 4h6v2H8z"/></svg>',
-                24,
-            )
-        )
+        self.pdf_btn.setIcon(svg_icon(_DOCUMENT_SVG, 24))
         self.pdf_btn.setIconSize(QSize(24, 24))
         self.pdf_btn.setText("PDF")
         self.pdf_btn.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
@@ -206,15 +210,7 @@ class HomePage(QWidget):
         self.bulk_images_btn = QToolButton()
         self.bulk_images_btn.setObjectName("ActionButton")
         self.bulk_images_btn.setToolButtonStyle(Qt.ToolButtonTextUnderIcon)
-        self.bulk_images_btn.setIcon(
-            svg_icon(
-                '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#f01d85">'
-                '<path d="M4 4h7v7H4z"/><path d="M13 4h7v7h-7z" fill="#f7c6de"/>'
-                '<path d="M4 13h7v7H4z" fill="#f7c6de"/><path d="M13 13h7v7h-7z"/>'
-                '<path d="M12 9h3v2h-3z"/></svg>',
-                24,
-            )
-        )
+        self.bulk_images_btn.setIcon(svg_icon(_IMAGES_SVG, 24))
         self.bulk_images_btn.setIconSize(QSize(24, 24))
         self.bulk_images_btn.setText("Image Downloader")
         self.bulk_images_btn.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
@@ -223,14 +219,7 @@ class HomePage(QWidget):
         self.video_edit_btn = QToolButton()
         self.video_edit_btn.setObjectName("ActionButton")
         self.video_edit_btn.setToolButtonStyle(Qt.ToolButtonTextUnderIcon)
-        self.video_edit_btn.setIcon(
-            svg_icon(
-                '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#f01d85">'
-                '<path d="M4 5h10a2 2 0 0 1 2 2v1l4-2v10l-4-2v1a2 2 0 0 1-2 2H4a2 2 0 0 1-2-2V7a2 2 0 0 1 2-2Z"/>'
-                '<path d="M6 9h4v2H6zM6 13h6v2H6z" fill="#f7c6de"/></svg>',
-                24,
-            )
-        )
+        self.video_edit_btn.setIcon(svg_icon(_VIDEO_SVG, 24))
         self.video_edit_btn.setIconSize(QSize(24, 24))
         self.video_edit_btn.setText("Video Tools")
         self.video_edit_btn.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
@@ -255,14 +244,7 @@ class HomePage(QWidget):
         self.anime_upscale_btn = QToolButton()
         self.anime_upscale_btn.setObjectName("ActionButton")
         self.anime_upscale_btn.setToolButtonStyle(Qt.ToolButtonTextUnderIcon)
-        self.anime_upscale_btn.setIcon(
-            svg_icon(
-                '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#f01d85">'
-                '<path d="M4 6h16v12H4z"/><path d="M7 9h4v4H7z" fill="#f7c6de"/>'
-                '<path d="M14 9h3v3h-3z"/></svg>',
-                24,
-            )
-        )
+        self.anime_upscale_btn.setIcon(svg_icon(_UPSCALE_SVG, 24))
         self.anime_upscale_btn.setIconSize(QSize(24, 24))
         self.anime_upscale_btn.setText("Art Upscale")
         self.anime_upscale_btn.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
@@ -271,15 +253,7 @@ class HomePage(QWidget):
         self.generate_docs_btn = QToolButton()
         self.generate_docs_btn.setObjectName("ActionButton")
         self.generate_docs_btn.setToolButtonStyle(Qt.ToolButtonTextUnderIcon)
-        self.generate_docs_btn.setIcon(
-            svg_icon(
-                '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#f01d85">'
-                '<path d="M6 2h7l5 5v15a2 2 0 0 1-2 2H6a2 2 0 0 1-2-2V4a2 2 0 0 1 2-2Z"/>'
-                '<path d="M13 2v5h5" fill="#f7c6de"/>'
-                '<path d="M8 12h8v2H8zm0 4h6v2H8z"/></svg>',
-                24,
-            )
-        )
+        self.generate_docs_btn.setIcon(svg_icon(_DOCUMENT_SVG, 24))
         self.generate_docs_btn.setIconSize(QSize(24, 24))
         self.generate_docs_btn.setText("Generate Docs")
         self.generate_docs_btn.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
@@ -288,14 +262,7 @@ class HomePage(QWidget):
         self.rename_files_btn = QToolButton()
         self.rename_files_btn.setObjectName("ActionButton")
         self.rename_files_btn.setToolButtonStyle(Qt.ToolButtonTextUnderIcon)
-        self.rename_files_btn.setIcon(
-            svg_icon(
-                '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#f01d85">'
-                '<path d="M4 4h16v5H4z"/><path d="M4 10h10v10H4z" fill="#f7c6de"/>'
-                '<path d="M16 12h4v2h-4zM16 16h4v2h-4z"/></svg>',
-                24,
-            )
-        )
+        self.rename_files_btn.setIcon(svg_icon(_RENAME_SVG, 24))
         self.rename_files_btn.setIconSize(QSize(24, 24))
         self.rename_files_btn.setText("Rename Files")
         self.rename_files_btn.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
@@ -304,15 +271,7 @@ class HomePage(QWidget):
         self.speech_to_text_btn = QToolButton()
         self.speech_to_text_btn.setObjectName("ActionButton")
         self.speech_to_text_btn.setToolButtonStyle(Qt.ToolButtonTextUnderIcon)
-        self.speech_to_text_btn.setIcon(
-            svg_icon(
-                '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#f01d85">'
-                '<path d="M12 14a3 3 0 0 0 3-3V6a3 3 0 0 0-6 0v5a3 3 0 0 0 3 3Z"/>'
-                '<path d="M5 11a7 7 0 0 0 14 0" fill="#f7c6de"/>'
-                '<path d="M12 18v3m-3 0h6" fill="#f01d85"/></svg>',
-                24,
-            )
-        )
+        self.speech_to_text_btn.setIcon(svg_icon(_MIC_SVG, 24))
         self.speech_to_text_btn.setIconSize(QSize(24, 24))
         self.speech_to_text_btn.setText("Speech to Text")
         self.speech_to_text_btn.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
@@ -349,5 +308,8 @@ class HomePage(QWidget):
         else:
             self.on_theme_change("Light")
 
+    def _go_settings(self) -> None:
+        self.on_navigate("settings")
+
     def set_theme(self, theme: str) -> None:
         return
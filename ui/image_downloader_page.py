@@ -10,9 +10,7 @@ import requests
 from bs4 import BeautifulSoup
 from PIL import Image
 
-from PySide6.QtCore import QByteArray, Qt, QSize, QObject, QThread, Signal
-from PySide6.QtGui import QIcon, QPainter, QPixmap, QImage
-from PySide6.QtSvg import QSvgRenderer
+from PySide6.QtCore import Qt, QSize, QObject, QThread, Signal
 from PySide6.QtWidgets import (
     QFileDialog,
     QFrame,
@@ -29,16 +27,12 @@ from PySide6.QtWidgets import (
 )
 
 from services.state import AppState
+from ui.icons import SETTINGS_SVG, svg_icon
 
-
-def svg_icon(svg: str, size: int) -> QIcon:
-    image = QImage(size, size, QImage.Format_ARGB32)
-    image.fill(Qt.transparent)
-    painter = QPainter(image)
-    renderer = QSvgRenderer(QByteArray(svg.encode("utf-8")))
-    renderer.render(painter)
-    painter.end()
-    return QIcon(QPixmap.fromImage(image))
+_STYLE_BG_RE = re.compile(r"background-image\s*:\s*url\(([^)]+)\)", re.IGNORECASE)
+_SRCSET_WIDTH_RE = re.compile(r"(\d+)w")
+_SIZE_SEGMENT_RE = re.compile(r"/s\d+x\d+/")
+_SMALL_TOKEN_RE = re.compile(r"(_s|-sm|_small|-small|thumb)", re.IGNORECASE)
 
 
 class ImageDownloadWorker(QObject):
@@ -108,22 +102,16 @@ class ImageDownloaderPage(QWidget):
         header_title.setObjectName("HeaderTitle")
         home_btn = QPushButton("Home")
         home_btn.setObjectName("NavButton")
-        home_btn.clicked.connect(lambda: self.on_navigate("home"))
+        home_btn.clicked.connect(self._go_home)
         nav_bar.addWidget(icon_badge)
         nav_bar.addWidget(header_title)
         nav_bar.addWidget(home_btn)
         nav_bar.addStretch(1)
         self.settings_icon_btn = QToolButton()
         self.settings_icon_btn.setObjectName("ThemeToggle")
-        self.settings_icon_btn.setIcon(
-            svg_icon(
-                '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#f01d85">'
-                '<path d="M12 8a4 4 0 1 0 0 8 4 4 0 0 0 0-8Zm8.94 4a7.87 7.87 0 0 0-.13-1.43l2.02-1.58-1.9-3.29-2.45.98a8.2 8.2 0 0 0-2.48-1.44L15.5 2h-3l-.5 2.24a8.2 8.2 0 0 0-2.48 1.44l-2.45-.98-1.9 3.29 2.02 1.58A7.87 7.87 0 0 0 7.06 12c0 .49.05.97.13 1.43l-2.02 1.58 1.9 3.29 2.45-.98a8.2 8.2 0 0 0 2.48 1.44L12.5 22h3l.5-2.24a8.2 8.2 0 0 0 2.48-1.44l2.45.98 1.9-3.29-2.02-1.58c.08-.46.13-.94.13-1.43Z" fill="#f7c6de"/></svg>',
-                12,
-            )
-        )
+        self.settings_icon_btn.setIcon(svg_icon(SETTINGS_SVG, 12))
         self.settings_icon_btn.setIconSize(QSize(12, 12))
-        self.settings_icon_btn.clicked.connect(lambda: self.on_navigate("settings"))
+        self.settings_icon_btn.clicked.connect(self._go_settings)
         nav_bar.addWidget(self.settings_icon_btn)
 
         top_divider = QFrame()
@@ -184,6 +172,12 @@ class ImageDownloaderPage(QWidget):
             self.theme_toggle.setIcon(self._sun_icon)
             self.on_theme_change("Light")
 
+    def _go_home(self) -> None:
+        self.on_navigate("home")
+
+    def _go_settings(self) -> None:
+        self.on_navigate("settings")
+
     def set_theme(self, theme: str) -> None:
         return
 
@@ -318,9 +312,8 @@ class ImageDownloaderPage(QWidget):
                     break
 
         # Background images in inline styles
-        style_regex = re.compile(r"background-image\s*:\s*url\(([^)]+)\)", re.IGNORECASE)
         for tag in soup.find_all(style=True):
-            match = style_regex.search(tag.get("style", ""))
+            match = _STYLE_BG_RE.search(tag.get("style", ""))
             if match:
                 add(match.group(1).strip(" '\""), 20)
 
@@ -399,13 +392,13 @@ class ImageDownloaderPage(QWidget):
         return max_width
 
     def _extract_width(self, token: str) -> int:
-        match = re.search(r"(\d+)w", token)
+        match = _SRCSET_WIDTH_RE.search(token)
         return int(match.group(1)) if match else 0
 
     def _upgrade_url(self, url: str) -> str:
         upgraded = url
-        upgraded = re.sub(r"/s\d+x\d+/", "/s1080x1080/", upgraded)
-        upgraded = re.sub(r"(_s|-sm|_small|-small|thumb)", "large", upgraded, flags=re.IGNORECASE)
+        upgraded = _SIZE_SEGMENT_RE.sub("/s1080x1080/", upgraded)
+        upgraded = _SMALL_TOKEN_RE.sub("large", upgraded)
         upgraded = self._strip_size_params(upgraded)
         return upgraded
 
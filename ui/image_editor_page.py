@@ -3,7 +3,6 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 from PySide6.QtCore import (
-    QByteArray,
     QBuffer,
     QIODevice,
     QEvent,
@@ -15,7 +14,6 @@ from PySide6.QtCore import (
 )
 from PySide6.QtGui import (
     QColor,
-    QIcon,
     QImage,
     QKeySequence,
     QPainter,
@@ -23,7 +21,6 @@ from PySide6.QtGui import (
     QPixmap,
     QShortcut,
 )
-from PySide6.QtSvg import QSvgRenderer
 from PySide6.QtWidgets import (
     QComboBox,
     QFileDialog,
@@ -47,16 +44,7 @@ from PySide6.QtWidgets import (
 )
 
 from services.state import AppState
-
-
-def svg_icon(svg: str, size: int) -> QIcon:
-    image = QImage(size, size, QImage.Format_ARGB32)
-    image.fill(Qt.transparent)
-    painter = QPainter(image)
-    renderer = QSvgRenderer(QByteArray(svg.encode("utf-8")))
-    renderer.render(painter)
-    painter.end()
-    return QIcon(QPixmap.fromImage(image))
+from ui.icons import SETTINGS_SVG, svg_icon
 
 
 def pixmap_to_bytes(pixmap: QPixmap) -> bytes:
@@ -166,6 +154,8 @@ class ImageEditorPage(QWidget):
         self._current_path: Path | None = None
         self._undo_stack: list[EditorState] = []
         self._redo_stack: list[EditorState] = []
+        self.undo_btn: QPushButton | None = None
+        self.redo_btn: QPushButton | None = None
         self._resize_timer = QTimer(self)
         self._resize_timer.setSingleShot(True)
         self._resize_timer.timeout.connect(self._apply_resize)
@@ -238,22 +228,16 @@ class ImageEditorPage(QWidget):
         header_title.setObjectName("HeaderTitle")
         home_btn = QPushButton("Home")
         home_btn.setObjectName("NavButton")
-        home_btn.clicked.connect(lambda: self.on_navigate("home"))
+        home_btn.clicked.connect(self._go_home)
         nav_bar.addWidget(icon_badge)
         nav_bar.addWidget(header_title)
         nav_bar.addWidget(home_btn)
         nav_bar.addStretch(1)
         self.settings_icon_btn = QToolButton()
         self.settings_icon_btn.setObjectName("ThemeToggle")
-        self.settings_icon_btn.setIcon(
-            svg_icon(
-                '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#f01d85">'
-                '<path d="M12 8a4 4 0 1 0 0 8 4 4 0 0 0 0-8Zm8.94 4a7.87 7.87 0 0 0-.13-1.43l2.02-1.58-1.9-3.29-2.45.98a8.2 8.2 0 0 0-2.48-1.44L15.5 2h-3l-.5 2.24a8.2 8.2 0 0 0-2.48 1.44l-2.45-.98-1.9 3.29 2.02 1.58A7.87 7.87 0 0 0 7.06 12c0 .49.05.97.13 1.43l-2.02 1.58 1.9 3.29 2.45-.98a8.2 8.2 0 0 0 2.48 1.44L12.5 22h3l.5-2.24a8.2 8.2 0 0 0 2.48-1.44l2.45.98 1.9-3.29-2.02-1.58c.08-.46.13-.94.13-1.43Z" fill="#f7c6de"/></svg>',
-                12,
-            )
-        )
+        self.settings_icon_btn.setIcon(svg_icon(SETTINGS_SVG, 12))
         self.settings_icon_btn.setIconSize(QSize(12, 12))
-        self.settings_icon_btn.clicked.connect(lambda: self.on_navigate("settings"))
+        self.settings_icon_btn.clicked.connect(self._go_settings)
         nav_bar.addWidget(self.settings_icon_btn)
 
         top_divider = QFrame()
@@ -517,6 +501,12 @@ class ImageEditorPage(QWidget):
     def apply_state(self, state: AppState) -> None:
         self.set_theme(state.theme)
 
+    def _go_home(self) -> None:
+        self.on_navigate("home")
+
+    def _go_settings(self) -> None:
+        self.on_navigate("settings")
+
     def set_theme(self, theme: str) -> None:
         return
 
@@ -964,9 +954,9 @@ class ImageEditorPage(QWidget):
         self._update_undo_redo_state()
 
     def _update_undo_redo_state(self) -> None:
-        if hasattr(self, "undo_btn"):
+        if self.undo_btn is not None:
             self.undo_btn.setEnabled(len(self._undo_stack) > 1)
-        if hasattr(self, "redo_btn"):
+        if self.redo_btn is not None:
             self.redo_btn.setEnabled(bool(self._redo_stack))
 
     def _setup_shortcuts(self) -> None:
@@ -2,10 +2,9 @@ from __future__ import annotations
 
 from pathlib import Path
 import fnmatch
+import os
 
-from PySide6.QtCore import QByteArray, Qt, QSize
-from PySide6.QtGui import QIcon, QPainter, QPixmap, QImage
-from PySide6.QtSvg import QSvgRenderer
+from PySide6.QtCore import Qt, QSize
 from PySide6.QtWidgets import (
     QFrame,
     QHBoxLayout,
@@ -24,16 +23,7 @@ from PySide6.QtWidgets import (
 
 from services.state import AppState
 from services.ai_client import ai_available, generate_rename_plan
-
-
-def svg_icon(svg: str, size: int) -> QIcon:
-    image = QImage(size, size, QImage.Format_ARGB32)
-    image.fill(Qt.transparent)
-    painter = QPainter(image)
-    renderer = QSvgRenderer(QByteArray(svg.encode("utf-8")))
-    renderer.render(painter)
-    painter.end()
-    return QIcon(QPixmap.fromImage(image))
+from ui.icons import SETTINGS_SVG, svg_icon
 
 
 class RenameFilesPage(QWidget):
@@ -109,7 +99,7 @@ class RenameFilesPage(QWidget):
         header_title.setObjectName("HeaderTitle")
         self.home_btn = QPushButton("Home")
         self.home_btn.setObjectName("NavButton")
-        self.home_btn.clicked.connect(lambda: self.on_navigate("home"))
+        self.home_btn.clicked.connect(self._go_home)
         nav_bar.addWidget(icon_badge)
         nav_bar.addWidget(header_title)
         nav_bar.addWidget(self.home_btn)
@@ -117,15 +107,9 @@ class RenameFilesPage(QWidget):
 
         self.settings_icon_btn = QToolButton()
         self.settings_icon_btn.setObjectName("ThemeToggle")
-        self.settings_icon_btn.setIcon(
-            svg_icon(
-                '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#f01d85">'
-                '<path d="M12 8a4 4 0 1 0 0 8 4 4 0 0 0 0-8Zm8.94 4a7.87 7.87 0 0 0-.13-1.43l2.02-1.58-1.9-3.29-2.45.98a8.2 8.2 0 0 0-2.48-1.44L15.5 2h-3l-.5 2.24a8.2 8.2 0 0 0-2.48 1.44l-2.45-.98-1.9 3.29 2.02 1.58A7.87 7.87 0 0 0 7.06 12c0 .49.05.97.13 1.43l-2.02 1.58 1.9 3.29 2.45-.98a8.2 8.2 0 0 0 2.48 1.44L12.5 22h3l.5-2.24a8.2 8.2 0 0 0 2.48-1.44l2.45.98 1.9-3.29-2.02-1.58c.08-.46.13-.94.13-1.43Z" fill="#f7c6de"/></svg>',
-                12,
-            )
-        )
+        self.settings_icon_btn.setIcon(svg_icon(SETTINGS_SVG, 12))
         self.settings_icon_btn.setIconSize(QSize(12, 12))
-        self.settings_icon_btn.clicked.connect(lambda: self.on_navigate("settings"))
+        self.settings_icon_btn.clicked.connect(self._go_settings)
         nav_bar.addWidget(self.settings_icon_btn)
 
         top_divider = QFrame()
@@ -257,6 +241,12 @@ class RenameFilesPage(QWidget):
 
         root_layout.addWidget(card)
 
+    def _go_home(self) -> None:
+        self.on_navigate("home")
+
+    def _go_settings(self) -> None:
+        self.on_navigate("settings")
+
     def set_theme(self, theme: str) -> None:
         return
 
@@ -274,13 +264,17 @@ class RenameFilesPage(QWidget):
         self._load_files()
 
     def _load_files(self) -> None:
-        if not self._folder or not self._folder.exists():
+        if not self._folder:
+            return
+        try:
+            with os.scandir(self._folder) as entries:
+                self._files = [
+                    Path(entry.path)
+                    for entry in entries
+                    if not self._should_ignore(entry.name) and entry.is_file()
+                ]
+        except OSError:
             return
-        self._files = [
-            p
-            for p in self._folder.iterdir()
-            if p.is_file() and not self._should_ignore(p)
-        ]
         self.rename_table.setRowCount(0)
         self._plan = []
         has_files = bool(self._files)
@@ -288,12 +282,16 @@ class RenameFilesPage(QWidget):
         self.apply_btn.setEnabled(False)
         if not self._files:
             return
-        self.rename_table.setRowCount(len(self._files))
-        for idx, path in enumerate(self._files):
-            current_item = QTableWidgetItem(path.name)
-            new_item = QTableWidgetItem("")
-            self.rename_table.setItem(idx, 0, current_item)
-            self.rename_table.setItem(idx, 1, new_item)
+        self.rename_table.setUpdatesEnabled(False)
+        try:
+            self.rename_table.setRowCount(len(self._files))
+            for idx, path in enumerate(self._files):
+                current_item = QTableWidgetItem(path.name)
+                new_item = QTableWidgetItem("")
+                self.rename_table.setItem(idx, 0, current_item)
+                self.rename_table.setItem(idx, 1, new_item)
+        finally:
+            self.rename_table.setUpdatesEnabled(True)
 
     def _generate_plan(self) -> None:
         if not self._files:
@@ -312,13 +310,17 @@ class RenameFilesPage(QWidget):
             self._set_status("AI response was invalid.", error=True)
             return
         self._plan = list(zip(filenames, result.new_names))
-        for idx, (old, new) in enumerate(self._plan):
-            current_item = QTableWidgetItem(old)
-            new_item = QTableWidgetItem(new)
-            if old == new:
-                new_item.setForeground(Qt.gray)
-            self.rename_table.setItem(idx, 0, current_item)
-            self.rename_table.setItem(idx, 1, new_item)
+        self.rename_table.setUpdatesEnabled(False)
+        try:
+            for idx, (old, new) in enumerate(self._plan):
+                current_item = QTableWidgetItem(old)
+                new_item = QTableWidgetItem(new)
+                if old == new:
+                    new_item.setForeground(Qt.gray)
+                self.rename_table.setItem(idx, 0, current_item)
+                self.rename_table.setItem(idx, 1, new_item)
+        finally:
+            self.rename_table.setUpdatesEnabled(True)
         self._set_status("Plan ready.", error=False)
         self.apply_btn.setEnabled(True)
 
@@ -341,12 +343,9 @@ class RenameFilesPage(QWidget):
         self._load_files()
         self._set_status("Rename complete.", error=False)
 
-    def _should_ignore(self, path: Path) -> bool:
-        if not self._folder:
-            return False
-        rel = path.relative_to(self._folder).as_posix()
+    def _should_ignore(self, name: str) -> bool:
         for pattern in self._ignore_patterns:
-            if fnmatch.fnmatch(rel, pattern) or fnmatch.fnmatch(path.name, pattern):
+            if fnmatch.fnmatch(name, pattern):
                 return True
         return False
 
@@ -1,8 +1,6 @@
 from __future__ import annotations
 
-from PySide6.QtCore import QByteArray, Qt, QSize
-from PySide6.QtGui import QIcon, QPainter, QPixmap, QImage
-from PySide6.QtSvg import QSvgRenderer
+from PySide6.QtCore import Qt, QSize
 from PySide6.QtWidgets import (
     QFrame,
     QHBoxLayout,
@@ -15,16 +13,17 @@ from PySide6.QtWidgets import (
 )
 
 from services.state import AppState
+from ui.icons import SETTINGS_SVG, svg_icon
 
-
-def svg_icon(svg: str, size: int) -> QIcon:
-    image = QImage(size, size, QImage.Format_ARGB32)
-    image.fill(Qt.transparent)
-    painter = QPainter(image)
-    renderer = QSvgRenderer(QByteArray(svg.encode("utf-8")))
-    renderer.render(painter)
-    painter.end()
-    return QIcon(QPixmap.fromImage(image))
+_SUN_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#f01d85">'
+    '<circle cx="12" cy="12" r="5"/>'
+    "</svg>"
+)
+_MOON_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#f7c6de">'
+    '<path d="M21 14.5A8.5 8.5 0 1 1 9.5 3a7 7 0 1 0 11.5 11.5Z"/></svg>'
+)
 
 
 class SettingsPage(QWidget):
@@ -55,7 +54,7 @@ class SettingsPage(QWidget):
         header_title.setObjectName("HeaderTitle")
         home_btn = QPushButton("Home")
         home_btn.setObjectName("NavButton")
-        home_btn.clicked.connect(lambda: self.on_navigate("home"))
+        home_btn.clicked.connect(self._go_home)
         nav_bar.addWidget(icon_badge)
         nav_bar.addWidget(header_title)
         nav_bar.addWidget(home_btn)
@@ -64,13 +63,7 @@ class SettingsPage(QWidget):
         self.settings_icon_btn = QToolButton()
         self.settings_icon_btn.setObjectName("ThemeToggle")
         self.settings_icon_btn.setEnabled(False)
-        self.settings_icon_btn.setIcon(
-            svg_icon(
-                '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#f01d85">'
-                '<path d="M12 8a4 4 0 1 0 0 8 4 4 0 0 0 0-8Zm8.94 4a7.87 7.87 0 0 0-.13-1.43l2.02-1.58-1.9-3.29-2.45.98a8.2 8.2 0 0 0-2.48-1.44L15.5 2h-3l-.5 2.24a8.2 8.2 0 0 0-2.48 1.44l-2.45-.98-1.9 3.29 2.02 1.58A7.87 7.87 0 0 0 7.06 12c0 .49.05.97.13 1.43l-2.02 1.58 1.9 3.29 2.45-.98a8.2 8.2 0 0 0 2.48 1.44L12.5 22h3l.5-2.24a8.2 8.2 0 0 0 2.48-1.44l2.45.98 1.9-3.29-2.02-1.58c.08-.46.13-.94.13-1.43Z" fill="#f7c6de"/></svg>',
-                12,
-            )
-        )
+        self.settings_icon_btn.setIcon(svg_icon(SETTINGS_SVG, 12))
         self.settings_icon_btn.setIconSize(QSize(12, 12))
         nav_bar.addWidget(self.settings_icon_btn)
 
@@ -84,17 +77,8 @@ class SettingsPage(QWidget):
         subtitle = QLabel("Configure Orca.")
         subtitle.setObjectName("SubtitleLabel")
 
-        self._sun_icon = svg_icon(
-            '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#f01d85">'
-            '<circle cx="12" cy="12" r="5"/>'
-            "</svg>",
-            12,
-        )
-        self._moon_icon = svg_icon(
-            '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#f7c6de">'
-            '<path d="M21 14.5A8.5 8.5 0 1 1 9.5 3a7 7 0 1 0 11.5 11.5Z"/></svg>',
-            12,
-        )
+        self._sun_icon = svg_icon(_SUN_SVG, 12)
+        self._moon_icon = svg_icon(_MOON_SVG, 12)
 
         theme_card = QFrame()
         theme_card.setObjectName("OptionsCard")
@@ -160,6 +144,9 @@ class SettingsPage(QWidget):
             self.theme_toggle.setIcon(self._sun_icon)
             self.on_theme_change("Light")
 
+    def _go_home(self) -> None:
+        self.on_navigate("home")
+
     def set_theme(self, theme: str) -> None:
         self.theme_toggle.blockSignals(True)
         self.theme_toggle.setChecked(theme == "Dark")
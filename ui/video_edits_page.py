@@ -3,9 +3,7 @@ from __future__ import annotations
 import shutil
 from pathlib import Path
 
-from PySide6.QtCore import QByteArray, Qt, QSize, QUrl, QProcess
-from PySide6.QtGui import QIcon, QPainter, QPixmap, QImage
-from PySide6.QtSvg import QSvgRenderer
+from PySide6.QtCore import Qt, QSize, QUrl, QProcess
 from PySide6.QtMultimedia import QAudioOutput, QMediaPlayer
 from PySide6.QtMultimediaWidgets import QVideoWidget
 from PySide6.QtWidgets import (
@@ -28,16 +26,7 @@ from PySide6.QtWidgets import (
 )
 
 from services.state import AppState
-
-
-def svg_icon(svg: str, size: int) -> QIcon:
-    image = QImage(size, size, QImage.Format_ARGB32)
-    image.fill(Qt.transparent)
-    painter = QPainter(image)
-    renderer = QSvgRenderer(QByteArray(svg.encode("utf-8")))
-    renderer.render(painter)
-    painter.end()
-    return QIcon(QPixmap.fromImage(image))
+from ui.icons import SETTINGS_SVG, svg_icon
 
 
 class VideoEditsPage(QWidget):
@@ -88,7 +77,7 @@ class VideoEditsPage(QWidget):
         header_title.setObjectName("HeaderTitle")
         home_btn = QPushButton("Home")
         home_btn.setObjectName("NavButton")
-        home_btn.clicked.connect(lambda: self.on_navigate("home"))
+        home_btn.clicked.connect(self._go_home)
         nav_bar.addWidget(icon_badge)
         nav_bar.addWidget(header_title)
         nav_bar.addWidget(home_btn)
@@ -96,15 +85,9 @@ class VideoEditsPage(QWidget):
 
         self.settings_icon_btn = QToolButton()
         self.settings_icon_btn.setObjectName("ThemeToggle")
-        self.settings_icon_btn.setIcon(
-            svg_icon(
-                '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#f01d85">'
-                '<path d="M12 8a4 4 0 1 0 0 8 4 4 0 0 0 0-8Zm8.94 4a7.87 7.87 0 0 0-.13-1.43l2.02-1.58-1.9-3.29-2.45.98a8.2 8.2 0 0 0-2.48-1.44L15.5 2h-3l-.5 2.24a8.2 8.2 0 0 0-2.48 1.44l-2.45-.98-1.9 3.29 2.02 1.58A7.87 7.87 0 0 0 7.06 12c0 .49.05.97.13 1.43l-2.02 1.58 1.9 3.29 2.45-.98a8.2 8.2 0 0 0 2.48 1.44L12.5 22h3l.5-2.24a8.2 8.2 0 0 0 2.48-1.44l2.45.98 1.9-3.29-2.02-1.58c.08-.46.13-.94.13-1.43Z" fill="#f7c6de"/></svg>',
-                12,
-            )
-        )
+        self.settings_icon_btn.setIcon(svg_icon(SETTINGS_SVG, 12))
         self.settings_icon_btn.setIconSize(QSize(12, 12))
-        self.settings_icon_btn.clicked.connect(lambda: self.on_navigate("settings"))
+        self.settings_icon_btn.clicked.connect(self._go_settings)
         nav_bar.addWidget(self.settings_icon_btn)
 
         top_divider = QFrame()
@@ -293,11 +276,8 @@ class VideoEditsPage(QWidget):
         self.preview_stack.addWidget(self.preview_label)
         self.preview_stack.setCurrentWidget(self.preview_label)
 
-        self.player = QMediaPlayer(self)
-        self.audio_output = QAudioOutput(self)
-        self.audio_output.setVolume(0.6)
-        self.player.setAudioOutput(self.audio_output)
-        self.player.setVideoOutput(self.video_widget)
+        self.player: QMediaPlayer | None = None
+        self.audio_output: QAudioOutput | None = None
 
         preview_layout.addWidget(preview_frame, 1)
 
@@ -360,6 +340,12 @@ class VideoEditsPage(QWidget):
 
         root_layout.addWidget(card)
 
+    def _go_home(self) -> None:
+        self.on_navigate("home")
+
+    def _go_settings(self) -> None:
+        self.on_navigate("settings")
+
     def set_theme(self, theme: str) -> None:
         return
 
@@ -428,6 +414,7 @@ class VideoEditsPage(QWidget):
             return
         self.state.last_folder_path = str(Path(path).parent)
         self._video_path = Path(path)
+        self._ensure_player()
         self.player.setSource(QUrl.fromLocalFile(path))
         self.player.play()
         self.preview_stack.setCurrentWidget(self.video_widget)
@@ -435,9 +422,19 @@ class VideoEditsPage(QWidget):
         self._set_file_details(self._video_path)
         self.close_video_btn.setVisible(True)
 
+    def _ensure_player(self) -> None:
+        if self.player is not None:
+            return
+        self.player = QMediaPlayer(self)
+        self.audio_output = QAudioOutput(self)
+        self.audio_output.setVolume(0.6)
+        self.player.setAudioOutput(self.audio_output)
+        self.player.setVideoOutput(self.video_widget)
+
     def _close_video(self) -> None:
-        self.player.stop()
-        self.player.setSource(QUrl())
+        if self.player is not None:
+            self.player.stop()
+            self.player.setSource(QUrl())
         self._video_path = None
         self.preview_stack.setCurrentWidget(self.preview_label)
         self._clear_file_details()
@@ -603,6 +600,7 @@ class VideoEditsPage(QWidget):
         if exit_code == 0:
             self._set_status("Done.", error=False)
             if self._last_output_path and self._last_output_path.exists():
+                self._ensure_player()
                 self.player.setSource(QUrl.fromLocalFile(str(self._last_output_path)))
                 self.player.play()
         else: